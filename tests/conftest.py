@@ -0,0 +1,18 @@
+# tests/conftest.py
+import pytest
+from django.core.management import call_command
+from django.test import override_settings
+
+from todo_project import settings as prod_settings
+
+# settings_test rebinds STORAGES only in its own module, so this is still the
+# storage the app ships with.
+PRODUCTION_STORAGES = prod_settings.STORAGES
+
+
+@pytest.fixture
+def collected(tmp_path):
+    """Run collectstatic with the production storage into a temp STATIC_ROOT."""
+    with override_settings(STATIC_ROOT=tmp_path, STORAGES=PRODUCTION_STORAGES):
+        call_command("collectstatic", interactive=False, verbosity=0)
+        yield tmp_path
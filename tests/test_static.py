@@ -0,0 +1,75 @@
+# tests/test_static.py
+import gzip
+import re
+
+import brotli
+import pytest
+from django.contrib.staticfiles.storage import staticfiles_storage
+from django.test import Client
+from django.urls import reverse
+"""
+Static asset pipeline
+
+Purpose:
+- collectstatic produces a hashed copy of each asset plus .gz/.br variants
+- Rendered pages link the hashed URL, not the raw file name
+- WhiteNoise serves the hashed URL with an immutable Cache-Control header
+- The compressed variant is chosen from the client's Accept-Encoding
+
+These tests use the `collected` fixture (tests/conftest.py), which runs
+collectstatic into a temporary STATIC_ROOT with the production storage.
+"""
+
+
+def test_collectstatic_writes_hashed_and_compressed_files(collected):
+    hashed = staticfiles_storage.stored_name("css/styles.css")
+    assert hashed != "css/styles.css"
+
+    original = (collected / hashed).read_bytes()
+    assert gzip.decompress((collected / f"{hashed}.gz").read_bytes()) == original
+    assert brotli.decompress((collected / f"{hashed}.br").read_bytes()) == original
+
+
+@pytest.mark.django_db
+def test_page_links_hashed_stylesheet(collected):
+    resp = Client().get(reverse("task_list"))
+
+    assert resp.status_code == 200
+    assert re.search(
+        rb'<link rel="stylesheet" href="/static/css/styles\.[0-9a-f]{12}\.css">',
+        resp.content,
+    )
+
+
+def test_hashed_asset_is_served_immutable(collected):
+    url = staticfiles_storage.url("css/styles.css")
+
+    resp = Client().get(url)
+
+    assert resp.status_code == 200
+    assert "immutable" in resp["Cache-Control"]
+    assert "max-age=315360000" in resp["Cache-Control"]
+
+
+def test_unhashed_asset_is_not_immutable(collected):
+    resp = Client().get("/static/css/styles.css")
+
+    assert resp.status_code == 200
+    assert "immutable" not in resp["Cache-Control"]
+
+
+@pytest.mark.parametrize("encoding, decompress", [
+    ("br", brotli.decompress),
+    ("gzip", gzip.decompress),
+])
+def test_compressed_variant_matches_accept_encoding(collected, encoding, decompress):
+    url = staticfiles_storage.url("css/styles.css")
+    plain = b"".join(Client().get(url).streaming_content)
+
+    resp = Client().get(url, HTTP_ACCEPT_ENCODING=encoding)
+    body = b"".join(resp.streaming_content)
+
+    assert resp["Content-Encoding"] == encoding
+    assert "Accept-Encoding" in resp["Vary"]
+    assert len(body) < len(plain)
+    assert decompress(body) == plain
@@ -0,0 +1,122 @@
+# tests/test_static_benchmark.py
+import re
+import statistics
+import time
+
+import pytest
+from django.contrib.staticfiles.views import serve
+from django.core.management import call_command
+from django.test import Client, RequestFactory
+
+from tasks.models import Task
+from tests.conftest import PRODUCTION_STORAGES
+"""
+Static asset benchmark: page view + stylesheet, before vs after the pipeline
+
+- before: plain storage, unhashed /static/css/styles.css served the way
+  `runserver` did (django.contrib.staticfiles.views.serve), uncompressed and
+  without Cache-Control, so the browser revalidates it on every view
+- after: manifest storage + WhiteNoise, hashed URL, brotli body, immutable
+
+A small browser model fetches the page, follows its stylesheet link and
+caches the CSS: immutable entries are reused without a request, others are
+revalidated with If-Modified-Since. Bytes are headers + body of every
+response, so a 304 revalidation still counts. Times are in-process (no
+network): the page render dominates "view ms", so on a real connection the
+byte savings and the skipped CSS round trip matter more than shown here.
+
+Print the table with:
+    pytest tests/test_static_benchmark.py -s --no-cov
+"""
+
+ROUNDS = 50
+STYLESHEET = re.compile(rb'<link rel="stylesheet" href="([^"]+)">')
+ACCEPT = {"HTTP_ACCEPT_ENCODING": "br, gzip"}
+
+
+def _size(resp):
+    body = b"".join(resp.streaming_content) if resp.streaming else resp.content
+    return len(resp.serialize_headers()) + len(body)
+
+
+def _fetch_devserver(client, url, headers):
+    request = RequestFactory().get(url, **headers)
+    return serve(request, url.removeprefix("/static/"), insecure=True)
+
+
+def _fetch_app(client, url, headers):
+    return client.get(url, **headers)
+
+
+def page_view(client, fetch_css, cache):
+    """One page view; returns (requests, bytes, css seconds), updates `cache`."""
+    page = client.get("/", **ACCEPT)
+    requests, size = 1, _size(page)
+
+    href = STYLESHEET.search(page.content).group(1).decode()
+    cached = cache.get(href)
+    if cached is not None and "immutable" in cached.get("Cache-Control", ""):
+        return requests, size, 0.0
+
+    headers = dict(ACCEPT)
+    if cached is not None and cached.has_header("Last-Modified"):
+        headers["HTTP_IF_MODIFIED_SINCE"] = cached["Last-Modified"]
+    start = time.perf_counter()
+    css = fetch_css(client, href, headers)
+    size += _size(css)
+    css_time = time.perf_counter() - start
+    if css.status_code == 200:
+        cache[href] = css
+    return requests + 1, size, css_time
+
+
+def measure(fetch_css):
+    """Requests, bytes and median ms (whole view, CSS only) per view type."""
+    client = Client()  # one handler, so WhiteNoise scans STATIC_ROOT once
+    results = {}
+    for view in ("first", "repeat"):
+        totals, css_times = [], []
+        for _ in range(ROUNDS):
+            cache = {}
+            if view == "repeat":
+                page_view(client, fetch_css, cache)
+            start = time.perf_counter()
+            requests, size, css_time = page_view(client, fetch_css, cache)
+            totals.append(time.perf_counter() - start)
+            css_times.append(css_time)
+        results[view] = (
+            requests,
+            size,
+            statistics.median(totals) * 1000,
+            statistics.median(css_times) * 1000,
+        )
+    return results
+
+
+@pytest.mark.benchmark
+@pytest.mark.django_db
+def test_static_pipeline_benchmark(tmp_path, settings):
+    for i in range(10):
+        Task.objects.create(title=f"Task {i}", description="Benchmark")
+
+    before = measure(_fetch_devserver)
+
+    settings.STATIC_ROOT = tmp_path
+    settings.STORAGES = PRODUCTION_STORAGES
+    call_command("collectstatic", interactive=False, verbosity=0)
+    after = measure(_fetch_app)
+
+    print(f"\n{'view':<8}{'setup':<8}{'requests':>9}{'bytes':>8}{'view ms':>9}{'css ms':>8}")
+    for view in ("first", "repeat"):
+        for label, results in (("before", before), ("after", after)):
+            requests, size, total_ms, css_ms = results[view]
+            print(
+                f"{view:<8}{label:<8}{requests:>9}{size:>8}"
+                f"{total_ms:>9.2f}{css_ms:>8.2f}"
+            )
+
+    # Compressed CSS on first view; no CSS request at all on repeat views
+    # (repeat bytes are ~equal: a 304 is tiny, the win is the saved round trip)
+    assert after["first"][1] < before["first"][1]
+    assert after["first"][0] == before["first"][0] == 2
+    assert after["repeat"][0] == 1 < before["repeat"][0]
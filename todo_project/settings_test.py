@@ -1,3 +1,15 @@
 from .settings import *  # import your normal settings
 # Temporarily remove the Django admin app to bypass the AdminSite error
 INSTALLED_APPS = [app for app in INSTALLED_APPS if app != "django.contrib.admin"]
+# The manifest storage needs collectstatic to have run; tests render templates
+# without it, so fall back to plain storage (tests/test_static.py opts back in).
+STORAGES = {
+    **STORAGES,
+    "staticfiles": {
+        "BACKEND": "django.contrib.staticfiles.storage.StaticFilesStorage",
+    },
+}
+# Tests don't run collectstatic; point STATIC_ROOT at an existing empty dir so
+# WhiteNoise has something to scan (tests/test_static.py collects into tmp_path).
+STATIC_ROOT = BASE_DIR / "staticfiles-test"
+STATIC_ROOT.mkdir(exist_ok=True)